@@ -9,7 +9,7 @@
 from __future__ import annotations
 
 from itertools import islice, chain
-from typing import Any, cast, ClassVar, Dict, Iterator, List, Optional, overload, Sequence, Tuple, Type, Union
+from typing import Any, cast, ClassVar, Dict, Iterator, List, Optional, overload, Sequence, Set, Tuple, Type, Union
 from weakref import WeakValueDictionary
 import sys
 from typing_validation import validate
@@ -20,7 +20,7 @@ from multiformats.varint import BytesLike, byteslike
 
 from . import raw
 from .err import MultiaddrKeyError, MultiaddrValueError
-from .raw import RawEncoder, RawDecoder, ProtoImpl, _validate_size
+from .raw import RawEncoder, RawDecoder, ProtoImpl
 
 class Proto:
     """
@@ -139,10 +139,10 @@ class Proto:
             Example usage:
 
             >>> ip4.implementation
-            (
-             <function ip4_encoder at 0x000002B4C9956310>,
-             <function ip4_decoder at 0x000002B4C99563A0>,
-             4
+            ProtoImpl(
+             raw_encoder=<function ip4_encoder at 0x000002B4C9956310>,
+             raw_decoder=<function ip4_decoder at 0x000002B4C99563A0>,
+             addr_size=4
             )
 
             :rtype: :obj:`~multiformats.multiaddr.raw.ProtoImpl`
@@ -161,7 +161,7 @@ class Proto:
 
             :rtype: :obj:`~multiformats.multiaddr.raw.RawEncoder` or :obj:`None`
         """
-        return self.implementation[0]
+        return self._implementation.raw_encoder
 
     @property
     def raw_decoder(self) -> Optional[RawDecoder]:
@@ -175,7 +175,7 @@ class Proto:
 
             :rtype: :obj:`~multiformats.multiaddr.raw.RawDecoder` or :obj:`None`
         """
-        return self.implementation[1]
+        return self._implementation.raw_decoder
 
     @property
     def addr_size(self) -> Optional[int]:
@@ -192,7 +192,7 @@ class Proto:
             4
 
         """
-        return self.implementation[2]
+        return self._implementation.addr_size
 
     @property
     def admits_addr(self) -> bool:
@@ -487,15 +487,15 @@ class Multiaddr(Sequence[Union[Addr, Proto]]):
     """
 
     _addrs: Tuple[Union[Addr, Proto], ...]
-    _proto_map: Dict[Proto, int]
+    _proto_map_cache: Optional[Dict[Proto, int]]
     _is_incomplete: bool
 
-    __slots__ = ("__weakref__", "_addrs", "_proto_map", "_is_incomplete")
+    __slots__ = ("__weakref__", "_addrs", "_proto_map_cache", "_is_incomplete")
 
     def __new__(cls, *addrs: Union[Addr, Proto]) -> "Multiaddr":
         l = len(addrs)
         is_incomplete = False
-        proto_map: Dict[Proto, int] = {}
+        seen: Set[Proto] = set()
         for idx, addr in enumerate(addrs):
             if isinstance(addr, Proto):
                 proto = addr
@@ -507,15 +507,37 @@ class Multiaddr(Sequence[Union[Addr, Proto]]):
             else:
                 validate(addr, Addr)
                 proto = addr.proto
-            if proto in proto_map:
+            if proto in seen:
                 raise MultiaddrValueError(f"Protocol {repr(proto.name)} appears twice in multiaddr.")
-            proto_map[proto] = idx
+            seen.add(proto)
+        instance: Multiaddr = super().__new__(cls)
+        instance._addrs = addrs
+        instance._proto_map_cache = None
+        instance._is_incomplete = is_incomplete
+        return instance
+
+    @classmethod
+    def _unchecked(cls, addrs: Tuple[Union[Addr, Proto], ...], proto_map: Optional[Dict[Proto, int]],
+                   is_incomplete: bool) -> "Multiaddr":
+        # skips validation: the caller is responsible for ensuring that ``addrs`` is a valid multiaddr
         instance: Multiaddr = super().__new__(cls)
         instance._addrs = addrs
-        instance._proto_map = proto_map
+        instance._proto_map_cache = proto_map
         instance._is_incomplete = is_incomplete
         return instance
 
+    @property
+    def _proto_map(self) -> Dict[Proto, int]:
+        # built lazily, since most multiaddrs are only ever iterated or serialised
+        proto_map = self._proto_map_cache
+        if proto_map is None:
+            proto_map = {
+                (addr if isinstance(addr, Proto) else addr.proto): idx
+                for idx, addr in enumerate(self._addrs)
+            }
+            self._proto_map_cache = proto_map
+        return proto_map
+
     @property
     def is_incomplete(self) -> bool:
         """
@@ -597,9 +619,10 @@ class Multiaddr(Sequence[Union[Addr, Proto]]):
         else:
             validate(value, Addr)
             proto = value.proto
-        if proto not in self._proto_map:
+        proto_map = self._proto_map
+        if proto not in proto_map:
             raise MultiaddrValueError(f"Protocol {repr(proto.name)} does not appear in multiaddr {str(self)}")
-        idx = self._proto_map[proto]
+        idx = proto_map[proto]
         if isinstance(value, Addr):
             if self[idx] != value:
                 raise MultiaddrValueError(f"Address {repr(value)} does not appear in multiaddr {str(self)}")
@@ -641,14 +664,25 @@ class Multiaddr(Sequence[Union[Addr, Proto]]):
         if isinstance(other, (int, str,)+byteslike):
             if not self.is_incomplete:
                 raise MultiaddrValueError("Unexpected address value. Expected Proto, Addr or Multiaddr.")
-            addrs = list(self)
+            addrs = self._addrs
             tail_proto = addrs[-1]
             assert isinstance(tail_proto, Proto)
-            return Multiaddr(*islice(addrs, 0, len(addrs)-1), tail_proto/other)
+            # the protocol stays at the same index, so the protocol map can be shared
+            return Multiaddr._unchecked(addrs[:-1]+(tail_proto/other,), self._proto_map_cache, False)
         if isinstance(other, (Addr, Proto)):
             if self.is_incomplete:
                 raise MultiaddrValueError("Expected address value (string or binary).")
-            return Multiaddr(*self, other)
+            if isinstance(other, Proto):
+                proto = other
+                is_incomplete = proto.addr_size != 0
+            else:
+                proto = other.proto
+                is_incomplete = False
+            proto_map = self._proto_map
+            if proto in proto_map:
+                raise MultiaddrValueError(f"Protocol {repr(proto.name)} appears twice in multiaddr.")
+            addrs = self._addrs
+            return Multiaddr._unchecked(addrs+(other,), {**proto_map, proto: len(addrs)}, is_incomplete)
         if isinstance(other, Multiaddr):
             if self.is_incomplete:
                 raise MultiaddrValueError("Expected address value (string or binary).")
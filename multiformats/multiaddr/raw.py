@@ -6,9 +6,9 @@
 
 from __future__ import annotations
 
-from ipaddress import IPv4Address, IPv6Address, AddressValueError
-from typing import Callable, Dict, Optional, Tuple
-from typing_validation import validate
+from ipaddress import IPv6Address
+import struct
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
 
 from multiformats.varint import BytesLike
 from .err import MultiaddrKeyError, MultiaddrValueError
@@ -19,11 +19,23 @@ RawEncoder = Callable[[str], bytes]
 RawDecoder = Callable[[BytesLike], str]
 """ Type alias for raw address value decoders. """
 
-ProtoImpl = Tuple[Optional[RawEncoder], Optional[RawDecoder], Optional[int]]
-""" Type alias for raw protocol implementation, as a triple ``(raw_encoder, raw_decoder, addr_size)``. """
+class ProtoImpl(NamedTuple):
+    """ Raw protocol implementation, as a triple ``(raw_encoder, raw_decoder, addr_size)``. """
+
+    raw_encoder: Optional[RawEncoder]
+    """ The raw encoder, or :obj:`None` if the protocol admits no address. """
+
+    raw_decoder: Optional[RawDecoder]
+    """ The raw decoder, or :obj:`None` if the protocol admits no address. """
+
+    addr_size: Optional[int]
+    """ The address size in bytes (0 if no address is admitted, :obj:`None` if address size is variable). """
 
 _proto_impl: Dict[str, ProtoImpl] = {}
 
+_NO_ADDR_IMPL = ProtoImpl(None, None, 0)
+""" Implementation shared by all protocols which admit no address value. """
+
 def get(name: str) -> ProtoImpl:
     """
         Gets the implementation ``(raw_encoder, raw_decoder, addr_size)`` for a protocol with given name.
@@ -37,10 +49,10 @@ def get(name: str) -> ProtoImpl:
         Example usage:
 
         >>> multiaddr.raw.get("ip4")
-        (
-         <function ip4_encoder at 0x000002DDE1655550>,
-         <function ip4_decoder at 0x000002DDE16555E0>,
-         4
+        ProtoImpl(
+         raw_encoder=<function ip4_encoder at 0x000002DDE1655550>,
+         raw_decoder=<function ip4_decoder at 0x000002DDE16555E0>,
+         addr_size=4
         )
 
         :param name: the protocol implementation name
@@ -48,10 +60,12 @@ def get(name: str) -> ProtoImpl:
 
         :raises KeyError: if no such protocol implementation exists
     """
-    validate(name, str)
-    if name not in _proto_impl:
+    if not isinstance(name, str):
+        raise TypeError(f"Expected str for name, found {type(name)}.")
+    impl = _proto_impl.get(name)
+    if impl is None:
         raise MultiaddrKeyError(f"No implementation for protocol {repr(name)}.")
-    return _proto_impl[name]
+    return impl
 
 
 def exists(name: str) -> bool:
@@ -66,7 +80,8 @@ def exists(name: str) -> bool:
         :param name: the protocol implementation name
         :type name: :obj:`str`
     """
-    validate(name, str)
+    if not isinstance(name, str):
+        raise TypeError(f"Expected str for name, found {type(name)}.")
     return name in _proto_impl
 
 
@@ -92,8 +107,9 @@ def register(name: str, raw_encoder: Optional[RawEncoder], raw_decoder: Optional
 
             def ip4_decoder(b: BytesLike) -> str:
                 validate(b, BytesLike)
-                _validate_size('ip4', b, 4)
-                return str(IPv4Address(b))
+                if len(b) != 4:
+                    raise MultiaddrValueError(f"Incorrect length for 'ip4' bytes: found {len(b)}, expected 4.")
+                return str(IPv4Address(bytes(b)))
 
             multiformats.raw.register("ip4", ip4_encoder, ip4_decoder, 4)
 
@@ -119,18 +135,21 @@ def register(name: str, raw_encoder: Optional[RawEncoder], raw_decoder: Optional
         :raises ValueError: if ``addr_size`` is 0 and either one of ``raw_encoder`` or ``raw_decoder`` is not :obj:`None`
         :raises ValueError: if ``overwrite`` is :obj:`False` and an implementation with the same name already exists
     """
-    validate(name, str)
+    if not isinstance(name, str):
+        raise TypeError(f"Expected str for name, found {type(name)}.")
     # validate(raw_encoder, Optional[RawEncoder]) # TODO: typing-validation does not yet support this
     # validate(raw_decoder, Optional[RawDecoder]) # TODO: typing-validation does not yet support this
-    validate(addr_size, Optional[int])
-    validate(overwrite, bool)
+    if addr_size is not None and not isinstance(addr_size, int):
+        raise TypeError(f"Expected int or None for addr_size, found {type(addr_size)}.")
+    if not isinstance(overwrite, bool):
+        raise TypeError(f"Expected bool for overwrite, found {type(overwrite)}.")
     if addr_size is not None and addr_size < 0:
         raise MultiaddrValueError("Size must be None or non-negative integer.")
     if addr_size == 0 and (raw_encoder is not None or raw_decoder is not None):
         raise MultiaddrValueError("Protocol admits no address (addr_size=0), set raw encoder and decoder to None.")
     if not overwrite and name in _proto_impl:
         raise MultiaddrValueError(f"Implementation for protocol {repr(name)} already exists.")
-    _proto_impl[name] = (raw_encoder, raw_decoder, addr_size)
+    _proto_impl[name] = _NO_ADDR_IMPL if addr_size == 0 else ProtoImpl(raw_encoder, raw_decoder, addr_size)
 
 
 def unregister(name: str) -> None:
@@ -148,68 +167,211 @@ def unregister(name: str) -> None:
 
         :raises KeyError: if no such protocol implementation exists
     """
-    validate(name, str)
-    if name not in _proto_impl:
+    if not isinstance(name, str):
+        raise TypeError(f"Expected str for name, found {type(name)}.")
+    if _proto_impl.pop(name, None) is None:
         raise MultiaddrKeyError(f"Implementation for protocol {repr(name)} does not exist.")
-    del _proto_impl[name]
 
-def _validate_size(name: str, b: BytesLike, size: int) -> None:
-    if len(b) != size:
-        raise MultiaddrValueError(f"Incorrect length for {repr(name)} bytes: found {len(b)}, expected {size}.")
+def _fixed_size_impl(name: str) -> Tuple[RawEncoder, RawDecoder, int]:
+    raw_encoder, raw_decoder, addr_size = get(name)
+    if not addr_size:
+        raise MultiaddrValueError(f"Protocol {repr(name)} does not have fixed-size addresses.")
+    assert raw_encoder is not None and raw_decoder is not None
+    return raw_encoder, raw_decoder, addr_size
+
+def encode_many(name: str, addr_values: Iterable[str]) -> bytes:
+    """
+        Encodes a batch of address values for a protocol with fixed-size addresses,
+        returning the concatenation of their binary representations.
+
+        The result can be viewed as a 2D array without copying, e.g. using
+        ``numpy.frombuffer(b, dtype=numpy.uint8).reshape(-1, addr_size)``.
+
+        Example usage:
+
+        >>> multiaddr.raw.encode_many("ip4", ["127.0.0.1", "192.168.1.1"]).hex()
+        '7f000001c0a80101'
+
+        :param name: the protocol implementation name
+        :type name: :obj:`str`
+        :param addr_values: the address values to encode
+        :type addr_values: iterable of :obj:`str`
+
+        :raises KeyError: if no such protocol implementation exists
+        :raises ValueError: if the protocol does not have fixed-size addresses
+        :raises ValueError: if any one of the address values is invalid
+    """
+    raw_encoder, _, _ = _fixed_size_impl(name)
+    return b"".join(map(raw_encoder, addr_values))
+
+def decode_many(name: str, b: BytesLike) -> List[str]:
+    """
+        Decodes a batch of address values for a protocol with fixed-size addresses,
+        from the concatenation of their binary representations.
+
+        Example usage:
+
+        >>> multiaddr.raw.decode_many("ip4", bytes.fromhex('7f000001c0a80101'))
+        ['127.0.0.1', '192.168.1.1']
+
+        :param name: the protocol implementation name
+        :type name: :obj:`str`
+        :param b: the concatenated binary address values
+        :type b: :obj:`~multiformats.varint.BytesLike`
+
+        :raises KeyError: if no such protocol implementation exists
+        :raises ValueError: if the protocol does not have fixed-size addresses
+        :raises ValueError: if the length of ``b`` is not a multiple of the address size
+        :raises ValueError: if any one of the address values is invalid
+    """
+    _, raw_decoder, addr_size = _fixed_size_impl(name)
+    if len(b) % addr_size != 0:
+        raise MultiaddrValueError(f"Length of {repr(name)} bytes is not a multiple of {addr_size}: found {len(b)}.")
+    if not isinstance(b, bytes):
+        b = bytes(b)
+    return [raw_decoder(b[i:i+addr_size]) for i in range(0, len(b), addr_size)]
+
+_DIGIT: bytes = bytes(1 if 0x30 <= c <= 0x39 else 0 for c in range(256))
+""" Lookup table of ASCII decimal digits, indexed by byte value. """
 
 def ip4_encoder(s: str) -> bytes:
     """ Encoder for 'ip4' protocol. """
-    validate(s, str)
-    try:
-        return IPv4Address(s).packed
-    except AddressValueError as e:
-        raise MultiaddrValueError(str(e)) from e
+    if not isinstance(s, str):
+        raise TypeError(f"Expected str, found {type(s)}.")
+    if not s.isascii():
+        raise MultiaddrValueError(f"Invalid character in IPv4 address {repr(s)}.")
+    octets: List[int] = []
+    acc = 0
+    num_digits = 0
+    for c in s.encode("ascii"):
+        if _DIGIT[c]:
+            if num_digits == 1 and acc == 0:
+                raise MultiaddrValueError(f"Leading zeros are not permitted in IPv4 address {repr(s)}.")
+            acc = acc*10+c-0x30
+            if acc > 255:
+                raise MultiaddrValueError(f"Octet out of range in IPv4 address {repr(s)}.")
+            num_digits += 1
+        elif c == 0x2E: # '.'
+            if num_digits == 0 or len(octets) == 3:
+                raise MultiaddrValueError(f"Expected 4 octets in {repr(s)}")
+            octets.append(acc)
+            acc = 0
+            num_digits = 0
+        else:
+            raise MultiaddrValueError(f"Invalid character in IPv4 address {repr(s)}.")
+    if num_digits == 0 or len(octets) != 3:
+        raise MultiaddrValueError(f"Expected 4 octets in {repr(s)}")
+    octets.append(acc)
+    return bytes(octets)
 
 def ip4_decoder(b: BytesLike) -> str:
     """ Decoder for 'ip4' protocol. """
-    validate(b, BytesLike)
-    _validate_size('ip4', b, 4)
-    try:
-        return str(IPv4Address(b))
-    except AddressValueError as e:
-        raise MultiaddrValueError(str(e)) from e
+    if not isinstance(b, (bytes, bytearray, memoryview)):
+        raise TypeError(f"Expected bytes, bytearray or memoryview, found {type(b)}.")
+    if len(b) != 4:
+        raise MultiaddrValueError(f"Incorrect length for 'ip4' bytes: found {len(b)}, expected 4.")
+    return f"{b[0]}.{b[1]}.{b[2]}.{b[3]}"
 
 register("ip4", ip4_encoder, ip4_decoder, 4)
 
+_HEX: bytes = bytes(
+    c-0x30 if 0x30 <= c <= 0x39 else c-0x57 if 0x61 <= c <= 0x66 else c-0x37 if 0x41 <= c <= 0x46 else 0xFF
+    for c in range(256)
+)
+""" Lookup table of ASCII hexadecimal digit values, indexed by byte value (``0xFF`` for non-hex bytes). """
+
+def _ip6_hextets(part: str, s: str, allow_ip4: bool) -> List[int]:
+    # parses a ':'-separated sequence of hextets, optionally ending in an embedded IPv4 address
+    groups = part.split(":")
+    hextets: List[int] = []
+    for idx, group in enumerate(groups):
+        if allow_ip4 and idx == len(groups)-1 and "." in group:
+            o = ip4_encoder(group)
+            hextets.append(o[0] << 8 | o[1])
+            hextets.append(o[2] << 8 | o[3])
+            break
+        if not 1 <= len(group) <= 4:
+            raise MultiaddrValueError(f"Invalid hextet {repr(group)} in IPv6 address {repr(s)}.")
+        x = 0
+        for c in group.encode("ascii"):
+            d = _HEX[c]
+            if d == 0xFF:
+                raise MultiaddrValueError(f"Invalid character in IPv6 address {repr(s)}.")
+            x = x << 4 | d
+        hextets.append(x)
+    return hextets
+
 def ip6_encoder(s: str) -> bytes:
     """ Encoder for 'ip6' protocol. """
-    validate(s, str)
-    try:
-        return IPv6Address(s).packed
-    except AddressValueError as e:
-        raise MultiaddrValueError(str(e)) from e
+    if not isinstance(s, str):
+        raise TypeError(f"Expected str, found {type(s)}.")
+    if not s.isascii():
+        raise MultiaddrValueError(f"Invalid character in IPv6 address {repr(s)}.")
+    head_s, sep, tail_s = s.partition("::")
+    if sep:
+        if "::" in tail_s:
+            raise MultiaddrValueError(f"At most one '::' permitted in IPv6 address {repr(s)}.")
+        head = _ip6_hextets(head_s, s, False) if head_s else []
+        tail = _ip6_hextets(tail_s, s, True) if tail_s else []
+        if len(head)+len(tail) > 7:
+            raise MultiaddrValueError(f"Expected at most 7 other hextets with '::' in {repr(s)}")
+    else:
+        head = _ip6_hextets(s, s, True)
+        tail = []
+        if len(head) != 8:
+            raise MultiaddrValueError(f"Expected 8 hextets in {repr(s)}")
+    b = bytearray(16)
+    for idx, x in enumerate(head):
+        b[2*idx] = x >> 8
+        b[2*idx+1] = x & 0xFF
+    offset = 16-2*len(tail)
+    for idx, x in enumerate(tail):
+        b[offset+2*idx] = x >> 8
+        b[offset+2*idx+1] = x & 0xFF
+    return bytes(b)
 
 def ip6_decoder(b: BytesLike) -> str:
     """ Decoder for 'ip6' protocol. """
-    validate(b, BytesLike)
-    _validate_size('ip6', b, 16)
-    try:
-        return str(IPv6Address(b))
-    except AddressValueError as e:
-        raise MultiaddrValueError(str(e)) from e
+    if not isinstance(b, (bytes, bytearray, memoryview)):
+        raise TypeError(f"Expected bytes, bytearray or memoryview, found {type(b)}.")
+    if len(b) != 16:
+        raise MultiaddrValueError(f"Incorrect length for 'ip6' bytes: found {len(b)}, expected 16.")
+    # every 128-bit integer is a valid IPv6 address, so this cannot raise
+    return str(IPv6Address(int.from_bytes(b, byteorder="big")))
 
 register("ip6", ip6_encoder, ip6_decoder, 16)
 
+_PACK_U16_BE = struct.Struct(">H").pack
+
 def tcp_udp_encoder(s: str) -> bytes:
     """ Encoder for 'tcp' and 'udp' protocols. """
-    validate(s, str)
-    if not s.isdigit():
+    if not isinstance(s, str):
+        raise TypeError(f"Expected str, found {type(s)}.")
+    if not 1 <= len(s) <= 5 or not s.isascii():
         raise MultiaddrValueError(f"Invalid UDP port {repr(s)}.")
-    x = int(s)
-    if not 0 <= x < 65536:
+    x = 0
+    for c in s.encode("ascii"):
+        if not _DIGIT[c]:
+            raise MultiaddrValueError(f"Invalid UDP port {repr(s)}.")
+        x = x*10+c-0x30
+    if x >= 65536:
         raise MultiaddrValueError(f"UDP port {repr(s)} out of range.")
-    return x.to_bytes(2, byteorder="big")
+    return _PACK_U16_BE(x)
+
+_port_strs: Dict[int, str] = {}
+""" Memo of decimal string representations for tcp/udp ports, filled on demand (at most 65536 entries). """
 
 def tcp_udp_decoder(b: BytesLike) -> str:
     """ Decoder for 'tcp' and 'udp' protocol. """
-    validate(b, BytesLike)
-    _validate_size('udp', b, 2)
-    return str(int.from_bytes(b, byteorder="big"))
+    if not isinstance(b, (bytes, bytearray, memoryview)):
+        raise TypeError(f"Expected bytes, bytearray or memoryview, found {type(b)}.")
+    if len(b) != 2:
+        raise MultiaddrValueError(f"Incorrect length for 'udp' bytes: found {len(b)}, expected 2.")
+    x = b[0] << 8 | b[1]
+    s = _port_strs.get(x)
+    if s is None:
+        s = _port_strs[x] = str(x)
+    return s
 
 register("tcp", tcp_udp_encoder, tcp_udp_decoder, 2)
 register("udp", tcp_udp_encoder, tcp_udp_decoder, 2)
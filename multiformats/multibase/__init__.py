@@ -8,21 +8,14 @@
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-import binascii
-import importlib.resources as importlib_resources
-from itertools import product
-import json
-import math
 import re
-from typing import Any, Callable, cast, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Type, Union
+from typing import Any, BinaryIO, cast, FrozenSet, Iterator, Mapping, Optional, TextIO, Tuple, Type, Union
 import sys
 
 from typing_extensions import Literal, Final
 from typing_validation import validate
 
-from bases import (base2, base16, base8, base10, base36, base58btc, base58flickr, base58ripple,
-                   base32, base32hex, base32z, base64, base64url, base45,)
+from bases import base16
 from multiformats_config.multibase import load_multibase_table
 
 from multiformats.multibase import raw
@@ -45,6 +38,28 @@ MultibaseStatusValues: Final[Tuple[MultibaseStatus, ...]] = (
     Collection of possible values for the :attr:`Multibase.status` property.
 """
 
+_status_values: Final[FrozenSet[str]] = frozenset(MultibaseStatusValues)
+
+_printable_codes: Final[Tuple[str, ...]] = tuple(
+    chr(i) if 0x20 <= i < 0x7F else f"0x{i:02X}" # same as "0x"+base16.encode(bytes([i]))
+    for i in range(0x100)
+)
+""" Printable versions of the single-byte multibase codes, indexed by code point (see :attr:`Multibase.code_printable`). """
+
+_NAME_RE: Final = re.compile(r"^[a-z][a-z0-9_-]+$")
+_HEX_DIGITS: Final = "0123456789abcdefABCDEF"
+
+_stream_blocks: Final[Mapping[str, Tuple[int, int]]] = {
+    **{name: (1, 2) for name in ("base16", "base16upper")},
+    **{f"base32{h}{p}{u}": (5, 8) for h in ("", "hex") for p in ("", "pad") for u in ("", "upper")},
+    **{f"base64{u}{p}": (3, 4) for u in ("", "url") for p in ("", "pad")},
+}
+"""
+    Block sizes ``(num_bytes, num_chars)`` for the multibases which can be encoded/decoded in chunks:
+    for these, the encoding of a concatenation of ``num_bytes``-aligned bytestrings is the
+    concatenation of their encodings.
+"""
+
 class Multibase:
     """
         Container class for a multibase encoding.
@@ -64,12 +79,20 @@ class Multibase:
         :type description: :obj:`str`, *optional*
     """
 
+    # pylint: disable = too-many-instance-attributes
+
     _name: str
     _code: str
     _status: MultibaseStatus
     _description: str
+    _code_printable: str
+    _raw_encoder: Optional[RawEncoder]
+    _raw_decoder: Optional[RawDecoder]
+    _as_tuple_cache: Tuple[Type["Multibase"], str, str, MultibaseStatus]
+    _hash: int
 
-    __slots__ = ("__weakref__", "_name", "_code", "_status", "_description")
+    __slots__ = ("__weakref__", "_name", "_code", "_status", "_description", "_code_printable",
+                 "_raw_encoder", "_raw_decoder", "_as_tuple_cache", "_hash")
 
     def __new__(cls,
                 name: str,
@@ -87,18 +110,27 @@ class Multibase:
         instance._code = code
         instance._status = status
         instance._description = description
+        instance._code_printable = Multibase._printable_code(code)
+        instance._raw_encoder = None
+        instance._raw_decoder = None
+        instance._as_tuple_cache = as_tuple = (Multibase, name, code, status)
+        instance._hash = hash(as_tuple)
         return instance
 
     def __getnewargs__(self) -> tuple[str, str, MultibaseStatus, str]:
         return (self.name, self.code, self.status, self.description)
 
+    def __getstate__(self) -> None:
+        # all state is restored by __new__: the cached raw encoder/decoder are not pickled
+        return None
+
     @staticmethod
     def _validate_name(name: Optional[str]) -> str:
         validate(name, Optional[str])
         assert name is not None
-        if not re.match(r"^[a-z][a-z0-9_-]+$", name): # ensures len(name) > 1
+        if not _NAME_RE.match(name): # ensures len(name) > 1
             raise MultibaseValueError(f"Invalid multibase encoding name {repr(name)}")
-        return name
+        return sys.intern(name)
 
     @staticmethod
     def validate_code(code: str) -> str:
@@ -120,7 +152,7 @@ class Multibase:
 
         """
         validate(code, str)
-        if re.match(r"^0x([0-9a-zA-Z][0-9a-zA-Z])+$", code):
+        if len(code) >= 4 and len(code) % 2 == 0 and code.startswith("0x") and not code[2:].strip(_HEX_DIGITS):
             ord_code = int(code, base=16)
             if ord_code in range(0x20, 0x7F):
                 raise MultibaseValueError("Multibase codes in hex format cannot be printable ASCII characters.")
@@ -129,12 +161,21 @@ class Multibase:
             raise MultibaseValueError("Multibase codes must be single-character strings or the hex digits '0x...' of a non-empty bytestring.")
         return code
 
+    @staticmethod
+    def _printable_code(code: str) -> str:
+        ord_code = ord(code)
+        if ord_code < 0x100:
+            return _printable_codes[ord_code]
+        # multi-byte codes are never printable ASCII characters
+        ord_code_num_bytes = (ord_code.bit_length()+7)//8
+        ord_code_bytes = ord_code.to_bytes(ord_code_num_bytes, byteorder="big")
+        return "0x"+base16.encode(ord_code_bytes)
+
     @staticmethod
     def _validate_status(status: str) -> MultibaseStatus:
-        # if status not in ("draft", "candidate", "default"):
-        if status not in MultibaseStatusValues:
+        if status not in _status_values:
             raise MultibaseValueError(f"Invalid multibase encoding status {repr(status)}.")
-        return cast(MultibaseStatus, status)
+        return cast(MultibaseStatus, sys.intern(status))
 
     @property
     def code(self) -> str:
@@ -165,13 +206,7 @@ class Multibase:
             '0x00'
 
         """
-        code = self.code
-        ord_code = ord(code)
-        if ord_code not in range(0x20, 0x7F):
-            ord_code_num_bytes = max(1, math.ceil(ord_code.bit_length()/8))
-            ord_code_bytes = ord_code.to_bytes(ord_code_num_bytes, byteorder="big")
-            return "0x"+base16.encode(ord_code_bytes)
-        return code
+        return self._code_printable
 
     @property
     def status(self) -> MultibaseStatus:
@@ -204,20 +239,32 @@ class Multibase:
         """
             Returns the raw encoder for this encoding: given bytes, it produces the encoded string without the multibase prefix.
         """
-        enc = raw.get(self.name)
-        if enc is None:
-            raise NotImplementedError(f"Multibase/decoding for {repr(self.name)} is not yet implemented.")
-        return enc.encode
+        raw_encoder = self._raw_encoder
+        if raw_encoder is None:
+            enc = raw.get(self.name)
+            if enc is None:
+                raise NotImplementedError(f"Multibase/decoding for {repr(self.name)} is not yet implemented.")
+            # for plain custom encodings, cache the raw function itself rather than the method forwarding to it
+            # (subclasses may override encode, so they are not unwrapped)
+            raw_encoder = enc.raw_encoder if type(enc) is raw.CustomEncoding else enc.encode # pylint: disable = unidiomatic-typecheck
+            self._raw_encoder = raw_encoder
+        return raw_encoder
 
     @property
     def raw_decoder(self) -> RawDecoder:
         """
             Returns the raw encoder for this encoding: given a string without the multibase prefix, it produces the decoded data.
         """
-        enc = raw.get(self.name)
-        if enc is None:
-            raise NotImplementedError(f"Multibase/decoding for {repr(self.name)} is not yet implemented.")
-        return enc.decode
+        raw_decoder = self._raw_decoder
+        if raw_decoder is None:
+            enc = raw.get(self.name)
+            if enc is None:
+                raise NotImplementedError(f"Multibase/decoding for {repr(self.name)} is not yet implemented.")
+            # for plain custom encodings, cache the raw function itself rather than the method forwarding to it
+            # (subclasses may override decode, so they are not unwrapped)
+            raw_decoder = enc.raw_decoder if type(enc) is raw.CustomEncoding else enc.decode # pylint: disable = unidiomatic-typecheck
+            self._raw_decoder = raw_decoder
+        return raw_decoder
 
     def encode(self, b: BytesLike) -> str:
         """
@@ -234,7 +281,10 @@ class Multibase:
             :type s: :class:`~multiformats.varint.BytesLike`
 
         """
-        return self.code+self.raw_encoder(b)
+        raw_encoder = self._raw_encoder
+        if raw_encoder is None:
+            raw_encoder = self.raw_encoder
+        return self._code+raw_encoder(b)
 
     def decode(self, s: str) -> bytes:
         """
@@ -255,11 +305,109 @@ class Multibase:
             :raises ValueError: see :func:`from_str`
             :raises KeyError: see :func:`from_str`
         """
-        encoding = from_str(s)
-        if encoding != self:
-            raise MultibaseValueError(f"Expected {repr(self.name)} encoding, "
-                                 f"found {repr(encoding.name)} encoding instead.")
-        return self.raw_decoder(s[1:])
+        if s and s[0] == self._code:
+            raw_decoder = self._raw_decoder
+            if raw_decoder is None:
+                raw_decoder = self.raw_decoder
+            return raw_decoder(s[1:])
+        encoding = from_str(s) # raises the appropriate error if s is empty or has an unknown code
+        raise MultibaseValueError(f"Expected {repr(self.name)} encoding, "
+                                  f"found {repr(encoding.name)} encoding instead.")
+
+    def encode_stream(self, src: BinaryIO, dst: TextIO, *, chunk_size: int = 65536) -> None:
+        """
+            Encodes bytes read from a binary stream into a multibase string written to a text stream.
+            The result is the same as that of ``dst.write(self.encode(src.read()))``.
+
+            For the base16, base32 and base64 multibases, data is encoded in chunks of approximately ``chunk_size`` bytes,
+            so that memory usage does not grow with the size of the data; for all other multibases,
+            the whole data is read and encoded at once.
+
+            Example usage:
+
+            >>> base32 = multibase.get("base32")
+            >>> src, dst = io.BytesIO(b"Hello World!"), io.StringIO()
+            >>> base32.encode_stream(src, dst)
+            >>> dst.getvalue()
+            'bjbswy3dpeblw64tmmqqq'
+
+            :param src: the binary stream to read the bytes from
+            :type src: :obj:`~typing.BinaryIO`
+            :param dst: the text stream to write the multibase string to
+            :type dst: :obj:`~typing.TextIO`
+            :param chunk_size: the approximate number of bytes to encode at a time
+            :type chunk_size: :obj:`int`, *optional*
+        """
+        validate(chunk_size, int)
+        raw_encoder = self._raw_encoder
+        if raw_encoder is None:
+            raw_encoder = self.raw_encoder
+        dst.write(self._code)
+        block = _stream_blocks.get(self.name)
+        if block is None:
+            dst.write(raw_encoder(src.read()))
+            return
+        num_bytes, _ = block
+        chunk_size = max(num_bytes, chunk_size-chunk_size%num_bytes)
+        leftover = b""
+        while True:
+            data = src.read(chunk_size)
+            if not data:
+                break
+            data = leftover+data
+            aligned_len = len(data)-len(data)%num_bytes
+            dst.write(raw_encoder(data[:aligned_len]))
+            leftover = data[aligned_len:]
+        if leftover:
+            dst.write(raw_encoder(leftover))
+
+    def decode_stream(self, src: TextIO, dst: BinaryIO, *, chunk_size: int = 65536) -> None:
+        """
+            Decodes a multibase string read from a text stream into bytes written to a binary stream.
+            The result is the same as that of ``dst.write(self.decode(src.read()))``.
+
+            For the base16, base32 and base64 multibases, data is decoded in chunks of approximately ``chunk_size`` chars,
+            so that memory usage does not grow with the size of the data; for all other multibases,
+            the whole string is read and decoded at once.
+
+            Example usage:
+
+            >>> base32 = multibase.get("base32")
+            >>> src, dst = io.StringIO("bjbswy3dpeblw64tmmqqq"), io.BytesIO()
+            >>> base32.decode_stream(src, dst)
+            >>> dst.getvalue()
+            b'Hello World!'
+
+            :param src: the text stream to read the multibase string from
+            :type src: :obj:`~typing.TextIO`
+            :param dst: the binary stream to write the bytes to
+            :type dst: :obj:`~typing.BinaryIO`
+            :param chunk_size: the approximate number of chars to decode at a time
+            :type chunk_size: :obj:`int`, *optional*
+
+            :raises ValueError: see :meth:`Multibase.decode`
+            :raises KeyError: see :meth:`Multibase.decode`
+        """
+        validate(chunk_size, int)
+        code = src.read(1)
+        block = _stream_blocks.get(self.name)
+        if code != self._code or block is None:
+            dst.write(self.decode(code+src.read())) # raises the appropriate error if the code is wrong
+            return
+        raw_decoder = self.raw_decoder
+        _, num_chars = block
+        chunk_size = max(num_chars, chunk_size-chunk_size%num_chars)
+        leftover = ""
+        while True:
+            s = src.read(chunk_size)
+            if not s:
+                break
+            s = leftover+s
+            aligned_len = len(s)-len(s)%num_chars
+            dst.write(raw_decoder(s[:aligned_len]))
+            leftover = s[aligned_len:]
+        if leftover:
+            dst.write(raw_decoder(leftover))
 
     def to_json(self) -> Mapping[str, str]:
         """
@@ -287,21 +435,23 @@ class Multibase:
         return repr(self)
 
     def __repr__(self) -> str:
-        return f"Multibase({', '.join(f'{k}={repr(v)}' for k, v in self.to_json().items())})"
+        return (f"Multibase(name={repr(self._name)}, code={repr(self._code_printable)}, "
+                f"status={repr(self._status)}, description={repr(self._description)})")
 
     @property
     def _as_tuple(self) -> Tuple[Type["Multibase"], str, str, MultibaseStatus]:
-        return (Multibase, self.name, self.code, self.status)
+        return self._as_tuple_cache
 
     def __hash__(self) -> int:
-        return hash(self._as_tuple)
+        return self._hash
 
     def __eq__(self, other: Any) -> bool:
         if self is other:
             return True
         if not isinstance(other, Multibase):
             return NotImplemented
-        return self._as_tuple == other._as_tuple
+        # same as comparing _as_tuple, but the (single-char) code is compared first, as it is most likely to differ
+        return self._code == other._code and self._name == other._name and self._status == other._status
 
 
 def get(name: Optional[str] = None, *, code: Optional[str] = None) -> Multibase:
@@ -330,17 +480,22 @@ def get(name: Optional[str] = None, *, code: Optional[str] = None) -> Multibase:
         :raises ValueError: unless exactly one of ``name`` and ``code`` is specified
 
     """
-    validate(name, Optional[str])
-    validate(code, Optional[str])
+    if name is not None and not isinstance(name, str):
+        raise TypeError(f"Expected str or None for name, found {type(name)}.")
+    if code is not None and not isinstance(code, str):
+        raise TypeError(f"Expected str or None for code, found {type(code)}.")
     if (name is None) == (code is None):
         raise MultibaseValueError("Must specify exactly one between encoding name and code.")
     if code is not None:
-        if code not in _code_table:
+        base = _code_table.get(code)
+        if base is None:
             raise MultibaseKeyError(f"No multibase encoding with code {repr(code)}.")
-        return _code_table[code]
-    if name not in _name_table:
+        return base
+    assert name is not None
+    base = _name_table.get(name)
+    if base is None:
         raise MultibaseKeyError(f"No multibase encoding named {repr(name)}.")
-    return _name_table[name]
+    return base
 
 
 def exists(name: Optional[str] = None, *, code: Optional[str] = None) -> bool:
@@ -362,12 +517,15 @@ def exists(name: Optional[str] = None, *, code: Optional[str] = None) -> bool:
         :raises ValueError: if the empty string is passed
         :raises ValueError: unless exactly one of ``name`` and ``code`` is specified
     """
-    validate(name, Optional[str])
-    validate(code, Optional[str])
+    if name is not None and not isinstance(name, str):
+        raise TypeError(f"Expected str or None for name, found {type(name)}.")
+    if code is not None and not isinstance(code, str):
+        raise TypeError(f"Expected str or None for code, found {type(code)}.")
     if (name is None) == (code is None):
         raise MultibaseValueError("Must specify exactly one between encoding name and code.")
     if code is not None:
-        code = Multibase.validate_code(code)
+        if len(code) != 1: # single-character codes are returned unchanged by validate_code
+            code = Multibase.validate_code(code)
         return code in _code_table
     return name in _name_table
 
@@ -400,8 +558,13 @@ def register(base: Multibase, *, overwrite: bool = False) -> None:
         raise MultibaseValueError(f"Multibase encoding with code {repr(base.code)} already exists: {_code_table[base.code]}")
     if base.name in _name_table and _name_table[base.name].code != base.code:
         raise MultibaseValueError(f"Multibase encoding with name {repr(base.name)} already exists: {_name_table[base.name]}")
+    existing = _code_table.get(base.code)
+    if existing is not None and existing == base and existing.description == base.description:
+        return # keep the registered instance (and its cached raw encoder/decoder), so that identity implies equality
+    global _sorted_table # pylint: disable = global-statement
     _code_table[base.code] = base
     _name_table[base.name] = base
+    _sorted_table = None
 
 
 def validate_multibase(multibase: Multibase) -> None:
@@ -415,7 +578,8 @@ def validate_multibase(multibase: Multibase) -> None:
         :raises KeyError: if no multibase with the given name is registered
         :raises ValueError: if a multibase with the given name is registered, but is different from the one given
     """
-    validate(multibase, Multibase)
+    if not isinstance(multibase, Multibase):
+        raise TypeError(f"Expected Multibase, found {type(multibase)}.")
     mc = get(multibase.name)
     if mc != multibase:
         raise MultibaseValueError(f"Multibase named {multibase.name} exists, but is not the one given.")
@@ -444,9 +608,11 @@ def unregister(name: Optional[str] = None, *, code: Optional[str] = None) -> Non
 
         :raises KeyError: if no such multibase exists
     """
+    global _sorted_table # pylint: disable = global-statement
     enc = get(name=name, code=code)
     del _code_table[enc.code]
     del _name_table[enc.name]
+    _sorted_table = None
 
 
 def table() -> Iterator[Multibase]:
@@ -460,8 +626,12 @@ def table() -> Iterator[Multibase]:
          'Z','b', 'c', 'f', 'h', 'k', 'm', 'p', 't', 'u', 'v', 'z']
 
     """
-    for code in sorted(_code_table.keys()):
-        yield _code_table[code]
+    global _sorted_table # pylint: disable = global-statement
+    sorted_table = _sorted_table
+    if sorted_table is None:
+        sorted_table = tuple(_code_table[code] for code in sorted(_code_table.keys()))
+        _sorted_table = sorted_table
+    return iter(sorted_table)
 
 
 def from_str(s: str) -> Multibase:
@@ -480,15 +650,15 @@ def from_str(s: str) -> Multibase:
         :raises ValueError: if the empty string is passed
         :raises KeyError: if no multibase exists with that code
     """
-    validate(s, str)
+    if not isinstance(s, str):
+        raise TypeError(f"Expected str, found {type(s)}.")
     if len(s) == 0:
         raise MultibaseValueError("Empty string is not valid for encoded data.")
-    if s[0] in _code_table:
-        return _code_table[s[0]]
-    for code in _code_table:
-        if s.startswith(code):
-            return get(code=code)
-    raise MultibaseKeyError("No known multibase code is a prefix of the given string.")
+    # all multibase codes are single characters, so the prefix is always s[0]
+    base = _code_table.get(s[0])
+    if base is None:
+        raise MultibaseKeyError("No known multibase code is a prefix of the given string.")
+    return base
 
 
 def encode(data: BytesLike, base: Union[str, "Multibase"]) -> str:
@@ -508,9 +678,11 @@ def encode(data: BytesLike, base: Union[str, "Multibase"]) -> str:
         :param base: the multibase to use
         :type base: :obj:`str` or :class:`Multibase`
     """
-    validate(base, Union[str, "Multibase"])
     if isinstance(base, str):
-        base = get(base)
+        named_base = _name_table.get(base)
+        base = named_base if named_base is not None else get(base) # get raises the appropriate error
+    elif not isinstance(base, Multibase):
+        raise TypeError(f"Expected str or Multibase, found {type(base)}.")
     return base.encode(data)
 
 
@@ -555,6 +727,9 @@ def decode_raw(s: str) -> Tuple[Multibase, bytes]:
 
 _code_table, _name_table = load_multibase_table()
 
+_sorted_table: Optional[Tuple[Multibase, ...]] = None
+""" Registered multibases in order of ascending code, computed by :func:`table` and reset by :func:`register`/:func:`unregister`. """
+
 # def build_multibase_tables(bases: Iterable[Multibase]) -> Tuple[Dict[str, Multibase], Dict[str, Multibase]]:
 #     """
 #         Creates code->encoding and name->encoding mappings from a finite iterable of encodings, returning the mappings.
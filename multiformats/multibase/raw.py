@@ -2,10 +2,22 @@ r"""
     Implementation of raw data encodings used by multibase encodings.
 
     The majority of the encodings is provided by the `bases <https://github.com/hashberg-io/bases>`_ library,
-    as instances of its :class:`~bases.encoding.base.BaseEncoding` class. The following custom encodings are also implemented:
+    as instances of its :class:`~bases.encoding.base.BaseEncoding` class. The following encodings are instead
+    instances of :class:`CustomEncoding`:
 
     - multibase identity
     - multibase proquints
+    - base16 and base16upper
+    - the eight base32 and base32hex variants (with/without padding, lower/upper case)
+    - base58btc and base58flickr
+    - base64, base64pad, base64url and base64urlpad
+
+    The base16, base32, base58 and base64 encodings above use faster encoders (backed by :mod:`binascii`,
+    :meth:`bytes.hex` or lookup tables) with output identical to that of the corresponding `bases` encodings,
+    which are still used for decoding.
+    Note that, since they are :class:`CustomEncoding` instances, they don't expose
+    :class:`~bases.encoding.base.BaseEncoding` attributes and methods such as ``alphabet`` or ``nopad()``:
+    if those are needed, use the encodings from the `bases` library directly.
 
     Core functionality is provided by the :func:`get` and :func:`exists` functions,
     which can be used to check whether a raw encoding with given name is known, and if so to get the corresponding object:
@@ -32,7 +44,7 @@ from __future__ import annotations
 
 import binascii
 from itertools import product
-from types import MappingProxyType
+import struct
 from typing import Any, Callable, Dict, List, Tuple, Union
 from typing_extensions import Literal
 from typing_validation import validate
@@ -65,6 +77,20 @@ class CustomEncoding:
         self._raw_encoder = raw_encoder
         self._raw_decoder = raw_decoder
 
+    @property
+    def raw_encoder(self) -> RawEncoder:
+        """
+            The custom raw encoder passed to the constructor.
+        """
+        return self._raw_encoder
+
+    @property
+    def raw_decoder(self) -> RawDecoder:
+        """
+            The custom raw decoder passed to the constructor.
+        """
+        return self._raw_decoder
+
     def encode(self, b: BytesLike) -> str:
         """
             Calls the custom raw encoder.
@@ -100,11 +126,15 @@ def get(name: str) -> RawEncoding:
 
         Example usage:
 
+        >>> raw_encoding.get("base10")
+        ZeropadBaseEncoding(StringAlphabet('0123456789'))
         >>> raw_encoding.get("base16")
-        ZeropadBaseEncoding(
-            StringAlphabet('0123456789abcdef',
-                           case_sensitive=False),
-            block_nchars=2)
+        CustomEncoding(<function _base16_encoding.<locals>.base16_raw_encoder at 0x...>,
+                       <bound method ... of ZeropadBaseEncoding(...)>)
+
+        The encodings listed in the module documentation (including base16, base32, base58 and base64)
+        are returned as :class:`CustomEncoding` instances, all other encodings from the `bases` library
+        are returned as :class:`~bases.encoding.base.BaseEncoding` instances.
 
         :param name: the name for the encoding
         :type name: :obj:`str`
@@ -113,7 +143,8 @@ def get(name: str) -> RawEncoding:
 
         :rtype: :class:`CustomEncoding` or :class:`~bases.encoding.base.BaseEncoding`
     """
-    validate(name, str)
+    if not isinstance(name, str):
+        raise TypeError(f"Expected str, found {type(name)}.")
     if name not in _raw_encodings:
         if not _jit_register_encoding(name):
             raise MultibaseKeyError(f"No raw encoding named {repr(name)}.")
@@ -133,7 +164,8 @@ def exists(name: str) -> bool:
         :type name: :obj:`str`
 
     """
-    validate(name, str)
+    if not isinstance(name, str):
+        raise TypeError(f"Expected str, found {type(name)}.")
     return name in _raw_encodings or name in _jit_registered_encodings
 
 
@@ -188,19 +220,118 @@ def unregister(name: str) -> None:
     del _raw_encodings[name]
 
 
+_base64_urlsafe_trans = bytes.maketrans(b"+/", b"-_")
+
+def _base64_encoding(base: BaseEncoding, *, url: bool, pad: bool) -> CustomEncoding:
+    # encodes with the C implementation in binascii (output is identical to that of 'bases'),
+    # decodes with the given 'bases' encoding (which validates its input strictly)
+    def base64_raw_encoder(b: BytesLike) -> str:
+        """
+            Implementation of the raw base64 encoder, using :func:`binascii.b2a_base64`.
+        """
+        encoded = binascii.b2a_base64(b, newline=False)
+        if url:
+            encoded = encoded.translate(_base64_urlsafe_trans)
+        s = encoded.decode("ascii")
+        return s if pad else s.rstrip("=")
+    return CustomEncoding(base64_raw_encoder, base.decode)
+
+def _base16_encoding(base: BaseEncoding, *, upper: bool) -> CustomEncoding:
+    # encodes with the C implementation of bytes.hex (output is identical to that of 'bases'),
+    # decodes with the given 'bases' encoding (bytes.fromhex would also accept whitespace and mixed case)
+    def base16_raw_encoder(b: BytesLike) -> str:
+        """
+            Implementation of the raw base16 encoder, using :meth:`bytes.hex`.
+        """
+        if not isinstance(b, bytes):
+            if not isinstance(b, (bytearray, memoryview)):
+                raise TypeError(f"Expected bytes, bytearray or memoryview, found {type(b)}.")
+            b = bytes(b)
+        s = b.hex()
+        return s.upper() if upper else s
+    return CustomEncoding(base16_raw_encoder, base.decode)
+
+_base32_alphabets = {
+    False: "ABCDEFGHIJKLMNOPQRSTUVWXYZ234567",
+    True: "0123456789ABCDEFGHIJKLMNOPQRSTUV",
+}
+
+_base32_num_chars = (0, 2, 4, 5, 7) # number of significant chars for a final block of 0-4 bytes
+
+def _base32_encoding(base: BaseEncoding, *, hex_alphabet: bool, pad: bool, upper: bool) -> CustomEncoding:
+    # encodes 5-byte blocks into 8 chars using a table of all 1024 two-char strings (output is identical to that of 'bases'),
+    # decodes with the given 'bases' encoding (which validates its input strictly)
+    alphabet = _base32_alphabets[hex_alphabet]
+    if not upper:
+        alphabet = alphabet.lower()
+    pairs = tuple(c0+c1 for c0 in alphabet for c1 in alphabet)
+    def base32_raw_encoder(b: BytesLike) -> str:
+        """
+            Implementation of the raw base32 encoder, processing 5 bytes (40 bits) at a time.
+        """
+        if not isinstance(b, bytes):
+            if not isinstance(b, (bytearray, memoryview)):
+                raise TypeError(f"Expected bytes, bytearray or memoryview, found {type(b)}.")
+            b = bytes(b)
+        leftover = len(b) % 5
+        if leftover:
+            b += bytes(5-leftover)
+        from_bytes = int.from_bytes
+        s = "".join([
+            pairs[x >> 30]+pairs[(x >> 20) & 0x3FF]+pairs[(x >> 10) & 0x3FF]+pairs[x & 0x3FF]
+            for x in (from_bytes(b[idx:idx+5], byteorder="big") for idx in range(0, len(b), 5))
+        ])
+        if leftover:
+            num_pad_chars = 8-_base32_num_chars[leftover]
+            s = s[:-num_pad_chars]
+            if pad:
+                s += "="*num_pad_chars
+        return s
+    return CustomEncoding(base32_raw_encoder, base.decode)
+
+_base58_alphabets = {
+    "btc": "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz",
+    "flickr": "123456789abcdefghijkmnopqrstuvwxyzABCDEFGHJKLMNPQRSTUVWXYZ",
+}
+
+_base58_chunk = 58**10 # 10 base58 digits per chunk, emitted as 5 pairs of digits
+
+def _base58_encoding(base: BaseEncoding, *, alphabet: str) -> CustomEncoding:
+    # converts the whole bytestring into a single int, then emits 10 digits per divmod on the int
+    # (output is identical to that of 'bases'), decodes with the given 'bases' encoding
+    pairs = tuple(c0+c1 for c0 in alphabet for c1 in alphabet)
+    zero = alphabet[0]
+    def base58_raw_encoder(b: BytesLike) -> str:
+        """
+            Implementation of the raw base58 encoder, processing 10 base58 digits at a time.
+        """
+        if not isinstance(b, bytes):
+            if not isinstance(b, (bytearray, memoryview)):
+                raise TypeError(f"Expected bytes, bytearray or memoryview, found {type(b)}.")
+            b = bytes(b)
+        num_leading_zeros = len(b)-len(b.lstrip(b"\x00"))
+        x = int.from_bytes(b, byteorder="big")
+        chunks: List[str] = []
+        while x:
+            x, y = divmod(x, _base58_chunk)
+            y, p4 = divmod(y, 3364)
+            y, p3 = divmod(y, 3364)
+            y, p2 = divmod(y, 3364)
+            p0, p1 = divmod(y, 3364)
+            chunks.append(pairs[p0]+pairs[p1]+pairs[p2]+pairs[p3]+pairs[p4])
+        chunks.reverse()
+        return zero*num_leading_zeros+"".join(chunks).lstrip(zero)
+    return CustomEncoding(base58_raw_encoder, base.decode)
+
+
 # register base encodings already instantiated by 'bases' v0.2.1
 register("base2", base2)
 register("base8", base8)
 register("base10", base10)
-register("base16upper", base16)
-register("base32padupper", base32)
-register("base32hexpadupper", base32hex)
 register("base32z", base32z)
 register("base36upper", base36)
-register("base58btc", base58btc)
-register("base58flickr", base58flickr)
-register("base64pad", base64)
-register("base64urlpad", base64url)
+# the remaining encodings wrap 'bases' encodings with faster encoders (building their lookup tables),
+# so they are registered just in time (see _jit_registered_encodings below)
 
 
 def _jit_register_identity_encoding() -> None:
@@ -208,7 +339,8 @@ def _jit_register_identity_encoding() -> None:
         """
             Implementation of the raw identity encoder according to the `multibase spec <https://github.com/multiformats/multibase/>`_.
         """
-        validate(b, Union[bytes, bytearray, memoryview])
+        if not isinstance(b, (bytes, bytearray, memoryview)):
+            raise TypeError(f"Expected bytes, bytearray or memoryview, found {type(b)}.")
         return str(b, "utf-8")
         # if isinstance(b, (bytes, bytearray)):
         #     return b.decode("utf-8")
@@ -219,7 +351,8 @@ def _jit_register_identity_encoding() -> None:
         """
             Implementation of the raw identity decoder according to the `multibase spec <https://github.com/multiformats/multibase/>`_.
         """
-        validate(s, str)
+        if not isinstance(s, str):
+            raise TypeError(f"Expected str, found {type(s)}.")
         return s.encode("utf-8")
     identity_raw_decoder.__repr__ = lambda: "identity_raw_decoder" # type: ignore
     register("identity", CustomEncoding(identity_raw_encoder, identity_raw_decoder))
@@ -230,56 +363,62 @@ def _jit_register_proquint_encoding() -> None:
     _proquint_consonants_set = frozenset("bdfghjklmnprstvz")
     _proquint_vowels = "aiou"
     _proquint_vowels_set = frozenset("aiou")
-    _proquint_consonants_revdir = MappingProxyType({char: idx for idx, char in enumerate(_proquint_consonants)})
-    _proquint_vowels_revdir = MappingProxyType({char: idx for idx, char in enumerate(_proquint_vowels)})
+    # encoding tables for 16-bit words: 'cvc' strings for the top 10 bits, 'vc' strings for the bottom 6 bits
+    # (a full table of 65536 'cvcvc' strings would be faster still, but would take several MB of memory)
+    _proquint_blocks_hi = tuple(c0+v0+c1 for c0 in _proquint_consonants for v0 in _proquint_vowels for c1 in _proquint_consonants)
+    _proquint_blocks_lo = tuple(v1+c2 for v1 in _proquint_vowels for c2 in _proquint_consonants)
+    # decoding table, indexed by byte value: 0x80|idx for the consonant with index idx,
+    # 0x40|idx for the vowel with index idx, 0x00 for all other bytes
+    _proquint_lut = bytearray(256)
+    for idx, char in enumerate(_proquint_consonants):
+        _proquint_lut[ord(char)] = 0x80|idx
+    for idx, char in enumerate(_proquint_vowels):
+        _proquint_lut[ord(char)] = 0x40|idx
     def proquint_raw_encoder(b: BytesLike) -> str:
         """
             Implementation of the proquint encoder according to the `proquint spec <https://arxiv.org/html/0901.4016>`_,
             with additional 'ro-' prefix as prescribed by the `multibase spec <https://github.com/multiformats/multibase/>`_
             and extended to include odd-length bytestrings (adding a final 3-letter block, using two zero pad bits).
         """
-        validate(b, BytesLike)
-        b = memoryview(b) # makes slicing cheap
-        consonants = _proquint_consonants
-        vowels = _proquint_vowels
-        char_blocks: List[str] = []
-        for idx in range(0, len(b), 2):
-            byte_block = b[idx: idx+2]
-            i = int.from_bytes(byte_block, byteorder="big")
-            if len(byte_block) == 2: # ordinary byte pair
-                i, c2 = divmod(i, 16) # 4 bits
-                i, v1 = divmod(i, 4)  # 2 bits
-                i, c1 = divmod(i, 16) # 4 bits
-                i, v0 = divmod(i, 4)  # 2 bits
-                i, c0 = divmod(i, 16) # 4 bits
-                assert i == 0
-                char_block = consonants[c0]+vowels[v0]+consonants[c1]+vowels[v1]+consonants[c2]
-                char_blocks.append(char_block)
-            else: # final byte for odd-length bytestrings
-                i <<= 2 # add 2 zero pad bits
-                i, c1 = divmod(i, 16) # 4 bits
-                i, v0 = divmod(i, 4)  # 2 bits
-                i, c0 = divmod(i, 16) # 4 bits
-                assert i == 0
-                char_block = consonants[c0]+vowels[v0]+consonants[c1]
-                char_blocks.append(char_block)
+        if not isinstance(b, (bytes, bytearray, memoryview)):
+            raise TypeError(f"Expected bytes, bytearray or memoryview, found {type(b)}.")
+        n = len(b)
+        num_pairs = n//2
+        blocks_hi = _proquint_blocks_hi
+        blocks_lo = _proquint_blocks_lo
+        # ordinary byte pairs: top 10 bits give 'cvc', bottom 6 bits give 'vc'
+        char_blocks = [blocks_hi[i >> 6]+blocks_lo[i & 0x3F]
+                       for i in struct.unpack(f">{num_pairs}H", b[:2*num_pairs])]
+        if n % 2: # final byte for odd-length bytestrings
+            char_blocks.append(blocks_hi[b[n-1] << 2]) # add 2 zero pad bits
         prefix = "ro-" # follows multibase code "p" to make "pro-", e.g. "pro-lusab-babad"
         return prefix+"-".join(char_blocks)
     proquint_raw_encoder.__repr__ = lambda: "proquint_raw_encoder" # type: ignore
+    def proquint_char_error(s: str, start: int) -> binascii.Error:
+        # slow path, only used to build the error for the first incorrect char from the given position
+        for idx in range(start, len(s)):
+            char = s[idx]
+            if idx % 6 == 5: # separator
+                if char != "-":
+                    return binascii.Error(f"Incorrect char at position {idx}: expected '-', found {repr(char)}.")
+            elif idx % 2 == 0: # consonant
+                if char not in _proquint_consonants_set:
+                    return binascii.Error(f"Incorrect char at position {idx}: expected consonant in {repr(_proquint_consonants)}, "
+                                          f"found {repr(char)}.")
+            else: # vowel
+                if char not in _proquint_vowels_set:
+                    return binascii.Error(f"Incorrect char at position {idx}: expected vowel in {repr(_proquint_vowels)}, "
+                                          f"found {repr(char)}.")
+        raise AssertionError("No incorrect char found.")
     def proquint_raw_decoder(s: str) -> bytes:
         """
             Implementation of the proquint decoder according to the `proquint spec <https://arxiv.org/html/0901.4016>`_,
             with additional 'ro-' prefix as prescribed by the `multibase spec <https://github.com/multiformats/multibase/>`_
             and extended to include odd-length bytestrings (adding a final 3-letter block, using two zero pad bits).
         """
-        # pylint: disable = too-many-branches
-        validate(s, str)
-        consonants = _proquint_consonants
-        vowels = _proquint_vowels
-        consonants_set = _proquint_consonants_set
-        vowels_set = _proquint_vowels_set
-        consonants_revdir = _proquint_consonants_revdir
-        vowels_revdir = _proquint_vowels_revdir
+        if not isinstance(s, str):
+            raise TypeError(f"Expected str, found {type(s)}.")
+        lut = _proquint_lut
         # validate string
         if not s.startswith("ro-"):
             raise binascii.Error("Multibase proquint encoded strings must start with 'ro-'.")
@@ -290,36 +429,31 @@ def _jit_register_proquint_encoding() -> None:
         # validate length for patterns cvcvc (len 5), cvcvc-...-cvc (len 6k+3) or cvcvc-...-cvcvc (len 6k+5)
         if len(s) % 6 not in (3, 5):
             raise binascii.Error("Proquint encoded string length must give remainder of 3 or 5 when divided by 6.")
-        # validate characters and convert encoded string into unsigned integer
-        i = 0
-        for idx, char in enumerate(s):
-            if idx % 6 == 5: # separator
-                if char != "-":
-                    raise binascii.Error(f"Incorrect char at position {idx}: expected '-', found {repr(char)}.")
-            elif idx % 2 == 0: # consonant
-                if char not in consonants_set:
-                    raise binascii.Error(f"Incorrect char at position {idx}: expected consonant in {repr(consonants)}, "
-                                         f"found {repr(char)}.")
-                i <<= 4 # make space for 4 bits
-                i += consonants_revdir[char] # insert consonant bits
-            else: # vowel
-                if char not in vowels_set:
-                    raise binascii.Error(f"Incorrect char at position {idx}: expected vowel in {repr(vowels)}, "
-                                         f"found {repr(char)}.")
-                i <<= 2 # make space for 2 bits
-                i += vowels_revdir[char] # insert vowel bits
-        # set number of bytes to number of quintuplets
-        nbytes = 2*((len(s)+1)//6)
-        # deal with the case of terminating tripled (odd bytestring length)
-        if len(s) % 6 == 3:
+        # one byte per char: non-ASCII chars are replaced by '?', which is not valid in proquints
+        sb = s.encode("ascii", "replace")
+        n = len(sb)
+        # set number of bytes to twice the number of quintuplets, plus one for a terminating triplet (odd bytestring length)
+        out = bytearray(2*((n+1)//6)+(n % 6 == 3))
+        # validate chars and write two bytes for each cvcvc block
+        pos = 0
+        for idx in range(0, n-3, 6):
+            x0, x1, x2, x3, x4 = lut[sb[idx]], lut[sb[idx+1]], lut[sb[idx+2]], lut[sb[idx+3]], lut[sb[idx+4]]
+            if not (x0 & x2 & x4 & 0x80 and x1 & x3 & 0x40) or (idx+5 < n and sb[idx+5] != 0x2D):
+                raise proquint_char_error(s, idx)
+            out[pos] = (x0 & 0xF) << 4 | (x1 & 0x3) << 2 | (x2 & 0xF) >> 2
+            out[pos+1] = (x2 & 0x3) << 6 | (x3 & 0x3) << 4 | (x4 & 0xF)
+            pos += 2
+        # deal with the case of terminating triplet (odd bytestring length)
+        if n % 6 == 3:
+            x0, x1, x2 = lut[sb[n-3]], lut[sb[n-2]], lut[sb[n-1]]
+            if not (x0 & x2 & 0x80 and x1 & 0x40):
+                raise proquint_char_error(s, n-3)
             # ensure pad bits are zero
-            i, pad_bits = divmod(i, 4)
+            pad_bits = x2 & 0x3
             if pad_bits != 0:
                 raise binascii.Error(f"Expected pad bits to be 00, found {bin(pad_bits)[2:]} instead.")
-            # add an extra byte
-            nbytes += 1
-        # convert unsigned integer to bytes and return
-        return i.to_bytes(nbytes, byteorder="big")
+            out[pos] = (x0 & 0xF) << 4 | (x1 & 0x3) << 2 | (x2 & 0xF) >> 2
+        return bytes(out)
     proquint_raw_decoder.__repr__ = lambda: "proquint_raw_decoder" # type: ignore
     register("proquint", CustomEncoding(proquint_raw_encoder, proquint_raw_decoder))
 
@@ -329,38 +463,47 @@ def _jit_register_base_encoding(b: Literal[16, 32, 36, 64],
                        _upper: bool = False,
                        _url: bool = False) -> None:
     if b == 64:
-        assert not _hex and not _pad and not _upper
-        if _url:
-            register("base64url", base64url.nopad())
-        else:
-            register("base64", base64.nopad())
+        assert not _hex and not _upper
+        base = base64url if _url else base64
+        if not _pad:
+            base = base.nopad()
+        key = f"base64{'url' if _url else ''}{'pad' if _pad else ''}"
+        register(key, _base64_encoding(base, url=_url, pad=_pad))
         return
     assert not _url
     if b in (16, 36):
-        assert not _hex and not _pad and not _upper
+        assert not _hex and not _pad
         if b == 16:
-            register("base16", base16.lower())
+            if _upper:
+                register("base16upper", _base16_encoding(base16, upper=True))
+            else:
+                register("base16", _base16_encoding(base16.lower(), upper=False))
         else:
+            assert not _upper # 'base36upper' is registered directly
             register("base36", base36.lower())
         return
-    assert b == 32 and (not _pad or not _upper)
+    assert b == 32
     base = base32hex if _hex else base32
     if not _pad:
         base = base.nopad()
     if not _upper:
         base = base.lower()
     key = f"base32{'hex' if _hex else ''}{'pad' if _pad else ''}{'upper' if _upper else ''}"
-    register(key, base)
+    register(key, _base32_encoding(base, hex_alphabet=_hex, pad=_pad, upper=_upper))
+
+def _jit_register_base58_encoding(variant: Literal["btc", "flickr"]) -> None:
+    base = base58btc if variant == "btc" else base58flickr
+    register(f"base58{variant}", _base58_encoding(base, alphabet=_base58_alphabets[variant]))
 
 _jit_registered_encodings: Dict[str, Tuple[Callable[..., Any], Any]] = {
     "identity": (_jit_register_identity_encoding, tuple()),
     "proquint": (_jit_register_proquint_encoding, tuple()),
     **{
-        f"base64{'url' if _url else ''}": (
+        f"base64{'url' if _url else ''}{'pad' if _pad else ''}": (
             _jit_register_base_encoding,
-            (64, False, False, False, _url)
+            (64, False, _pad, False, _url)
         )
-        for _url in (False, True)
+        for _url, _pad in product((False, True), repeat=2)
     },
     **{
         f"base{b}": (
@@ -369,6 +512,14 @@ _jit_registered_encodings: Dict[str, Tuple[Callable[..., Any], Any]] = {
         )
         for b in (16, 36)
     },
+    "base16upper": (_jit_register_base_encoding, (16, False, False, True)),
+    **{
+        f"base58{variant}": (
+            _jit_register_base58_encoding,
+            (variant,)
+        )
+        for variant in ("btc", "flickr")
+    },
     **{
         f"base32{'hex' if _hex else ''}{'pad' if _pad else ''}{'upper' if _upper else ''}": (
             _jit_register_base_encoding,
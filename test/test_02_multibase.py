@@ -4,11 +4,14 @@
 # import pytest
 # TODO: make tests parametrised
 
+import base64
+import io
 from random import Random
 
 import multiformats_config
 from multiformats import multibase
-from multiformats.multibase import Multibase
+from multiformats.multibase import Multibase, raw
+from multiformats.varint import BytesLike
 
 
 def test_exists() -> None:
@@ -113,6 +116,30 @@ def test_unregister() -> None:
     assert not multibase.exists(m2.name)
     assert not multibase.exists(code=m2.code)
 
+def test_custom_encoding_subclass() -> None:
+    """ Tests that overrides in `multibase.raw.CustomEncoding` subclasses are honoured. """
+    class ShortEncoding(raw.CustomEncoding):
+        def encode(self, b: BytesLike) -> str:
+            if len(b) > 4:
+                raise ValueError("Too many bytes.")
+            return super().encode(b)
+    base16 = raw.get("base16")
+    assert isinstance(base16, raw.CustomEncoding)
+    raw.register("my-short-base16", ShortEncoding(base16.raw_encoder, base16.raw_decoder))
+    enc = Multibase(name="my-short-base16", code="0x03", status="draft", description="my short base16")
+    multibase.register(enc)
+    try:
+        assert enc.encode(b"1234") == "\x0331323334"
+        assert enc.decode("\x0331323334") == b"1234"
+        try:
+            enc.encode(b"123456")
+            assert False, "Subclass encode override was bypassed."
+        except ValueError:
+            pass
+    finally:
+        multibase.unregister(enc.name)
+        raw.unregister("my-short-base16")
+
 def test_table() -> None:
     """ Tests `multibase.table`. """
     try:
@@ -238,3 +265,72 @@ def test_proquint() -> None:
         s = proquint.encode(b)
         error_msg = f"Proquint decode-encode error at sample #{idx}: b = {list(b)}, s = {repr(s)}"
         assert proquint.decode(s) == b, error_msg
+
+def test_proquint_invalid() -> None:
+    proquint = multibase.get("proquint")
+    for s in ["pro-babai", "pro-bxbab", "pro-babab+babab", "pro-bab\u00e9b", "pro-babab-bad", "pro-baba"]:
+        try:
+            proquint.decode(s)
+            assert False, f"Proquint string {repr(s)} should not be valid."
+        except ValueError:
+            pass
+
+def test_base64_stdlib() -> None:
+    for idx in range(nsamples):
+        b = bytes(rand.getrandbits(8) for _ in range(idx % 67))
+        std = base64.b64encode(b).decode("ascii")
+        url = base64.urlsafe_b64encode(b).decode("ascii")
+        for name, s in [("base64pad", std), ("base64", std.rstrip("=")),
+                        ("base64urlpad", url), ("base64url", url.rstrip("="))]:
+            enc = multibase.get(name)
+            assert enc.encode(b) == enc.code+s, f"{name} encode error at sample #{idx}"
+            assert enc.decode(enc.code+s) == b, f"{name} decode error at sample #{idx}"
+
+def test_base32_stdlib() -> None:
+    for idx in range(nsamples):
+        b = bytes(rand.getrandbits(8) for _ in range(idx % 67))
+        s = base64.b32encode(b).decode("ascii")
+        for name, expected in [("base32padupper", s), ("base32upper", s.rstrip("=")),
+                               ("base32pad", s.lower()), ("base32", s.lower().rstrip("="))]:
+            enc = multibase.get(name)
+            assert enc.encode(b) == enc.code+expected, f"{name} encode error at sample #{idx}"
+            assert enc.decode(enc.code+expected) == b, f"{name} decode error at sample #{idx}"
+    for name in ("base32padupper", "base32upper", "base32pad", "base32"):
+        for data in (5, [1, 2]):
+            try:
+                multibase.encode(data, name) # type: ignore
+                assert False, f"{name} should not encode {repr(data)}."
+            except TypeError:
+                pass
+
+def test_base16_stdlib() -> None:
+    for idx in range(nsamples):
+        b = bytes(rand.getrandbits(8) for _ in range(idx % 67))
+        s = base64.b16encode(b).decode("ascii")
+        for name, expected in [("base16upper", s), ("base16", s.lower())]:
+            enc = multibase.get(name)
+            assert enc.encode(b) == enc.code+expected, f"{name} encode error at sample #{idx}"
+            assert enc.decode(enc.code+expected) == b, f"{name} decode error at sample #{idx}"
+
+def test_base58() -> None:
+    base58btc = multibase.get("base58btc")
+    assert base58btc.encode(b"Hello World!") == "z2NEpo7TZRRrLZSi2U"
+    assert base58btc.encode(b"\x00\x00\x01") == "z112"
+    assert base58btc.encode(b"") == "z"
+    for name in ("base58btc", "base58flickr"):
+        enc = multibase.get(name)
+        for idx in range(nsamples):
+            b = bytes(idx % 3)+bytes(rand.getrandbits(8) for _ in range(idx % 67))
+            assert enc.decode(enc.encode(b)) == b, f"{name} decode-encode error at sample #{idx}"
+
+def test_stream() -> None:
+    for name in ("base16", "base32", "base32hexpadupper", "base64", "base64urlpad", "base58btc"):
+        enc = multibase.get(name)
+        for idx in range(64):
+            b = bytes(rand.getrandbits(8) for _ in range(idx*7))
+            dst = io.StringIO()
+            enc.encode_stream(io.BytesIO(b), dst, chunk_size=idx % 10 + 1)
+            assert dst.getvalue() == enc.encode(b), f"{name} stream encode error at sample #{idx}"
+            out = io.BytesIO()
+            enc.decode_stream(io.StringIO(dst.getvalue()), out, chunk_size=idx % 10 + 1)
+            assert out.getvalue() == b, f"{name} stream decode error at sample #{idx}"
@@ -25,7 +25,18 @@ invalid_multiaddr_strings = [
     "/ip4",
     "/ip4/::1",
     "/ip4/fdpsofodsajfdoisa",
+    "/ip4/256.0.0.1",
+    "/ip4/01.2.3.4",
+    "/ip4/1.2.3",
+    "/ip4/1.2.3.4.5",
+    "/ip4/1..3.4",
     "/ip6",
+    "/ip6/1::2::3",
+    "/ip6/1:2:3:4:5:6:7:8:9",
+    "/ip6/1:2:3:4:5:6:7",
+    "/ip6/12345::",
+    "/ip6/::ffff:01.2.3.4",
+    "/ip6/fe80::1%eth0",
     "/ip6zone",
     "/ip6zone/",
     "/ip6zone//ip6/fe80::1",
@@ -185,3 +196,46 @@ def test_random(sample: int, use_slash: bool) -> None:
     assert ma == multiaddr.parse(str(ma))
     bytes(ma)
     assert ma == multiaddr.decode(bytes(ma))
+
+def test_slash_duplicate_proto() -> None:
+    ip4 = Proto("ip4")
+    udp = Proto("udp")
+    ma = ip4/"127.0.0.1"/udp/9090
+    with pytest.raises(MultiaddrValueError):
+        ma/(ip4/"127.0.0.2") # pylint: disable = pointless-statement
+    with pytest.raises(MultiaddrValueError):
+        ma/udp # pylint: disable = pointless-statement
+    assert ma.index(udp) == 1
+    assert ma == Multiaddr(ip4/"127.0.0.1", udp/9090)
+
+@pytest.mark.parametrize("name, addr_values", [
+    ("ip4", ["127.0.0.1", "192.168.1.1", "0.0.0.0"]),
+    ("ip6", ["::1", "2601:9:4f81:9700:803e:ca65:66e8:c21"]),
+    ("udp", ["0", "9090", "65535"]),
+])
+def test_encode_decode_many(name: str, addr_values: List[str]) -> None:
+    proto = Proto(name)
+    b = multiaddr.raw.encode_many(name, addr_values)
+    assert b == b"".join(proto.validate(v)[1] for v in addr_values)
+    assert multiaddr.raw.decode_many(name, b) == addr_values
+    assert multiaddr.raw.decode_many(name, memoryview(b)) == addr_values
+    with pytest.raises(MultiaddrValueError):
+        multiaddr.raw.decode_many(name, b[:-1])
+
+def test_encode_decode_many_no_addr() -> None:
+    with pytest.raises(MultiaddrValueError):
+        multiaddr.raw.encode_many("quic", [])
+    with pytest.raises(MultiaddrValueError):
+        multiaddr.raw.decode_many("quic", b"")
+
+def test_no_addr_impl_shared() -> None:
+    assert multiaddr.raw.get("quic") is multiaddr.raw.get("tls")
+    assert Proto("quic").addr_size == 0
+
+def test_raw_non_str_name() -> None:
+    with pytest.raises(TypeError):
+        multiaddr.raw.get(5) # type: ignore
+    with pytest.raises(TypeError):
+        multiaddr.raw.exists(5) # type: ignore
+    with pytest.raises(TypeError):
+        multiaddr.raw.unregister(5) # type: ignore